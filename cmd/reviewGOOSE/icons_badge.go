@@ -16,25 +16,40 @@ import (
 var iconSmilingSource []byte
 
 //go:embed icons/warning.png
-var iconWarning []byte
+var iconWarningSource []byte
 
 //go:embed icons/lock.png
-var iconLock []byte
+var iconLockSource []byte
 
 var (
 	cache = icon.NewCache()
 
-	smiling     []byte
-	smilingOnce sync.Once
+	// Static icons are downsampled from their 512×512 masters once, on first use.
+	smiling = scaledOnce("happy face", iconSmilingSource)
+	warning = scaledOnce("warning", iconWarningSource)
+	lock    = scaledOnce("lock", iconLockSource)
 )
 
+// scaledOnce returns a function that scales src to tray size on first call
+// and returns the cached result afterwards. Falls back to src if scaling fails.
+func scaledOnce(name string, src []byte) func() []byte {
+	return sync.OnceValue(func() []byte {
+		scaled, err := icon.Scale(src)
+		if err != nil {
+			slog.Error("failed to scale icon", "icon", name, "error", err)
+			return src
+		}
+		return scaled
+	})
+}
+
 func getIcon(iconType IconType, counts PRCounts) []byte {
 	// Static icons for error states
 	if iconType == IconWarning {
-		return iconWarning
+		return warning()
 	}
 	if iconType == IconLock {
-		return iconLock
+		return lock()
 	}
 
 	incoming := counts.IncomingBlocked
@@ -42,16 +57,7 @@ func getIcon(iconType IconType, counts PRCounts) []byte {
 
 	// Happy face when nothing is blocked
 	if incoming == 0 && outgoing == 0 {
-		smilingOnce.Do(func() {
-			scaled, err := icon.Scale(iconSmilingSource)
-			if err != nil {
-				slog.Error("failed to scale happy face icon", "error", err)
-				smiling = iconSmilingSource
-				return
-			}
-			smiling = scaled
-		})
-		return smiling
+		return smiling()
 	}
 
 	// Check cache
@@ -63,7 +69,7 @@ func getIcon(iconType IconType, counts PRCounts) []byte {
 	badge, err := icon.Badge(incoming, outgoing)
 	if err != nil {
 		slog.Error("failed to generate badge", "error", err, "incoming", incoming, "outgoing", outgoing)
-		return smiling
+		return smiling()
 	}
 
 	cache.Put(incoming, outgoing, badge)
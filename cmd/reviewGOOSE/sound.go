@@ -3,11 +3,13 @@ package main
 import (
 	"context"
 	_ "embed"
+	"errors"
 	"log/slog"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"runtime"
+	"slices"
 	"strings"
 	"sync"
 	"time"
@@ -19,8 +21,41 @@ var jetSound []byte
 //go:embed sounds/honk.wav
 var honkSound []byte
 
+// soundFile is an embedded sound and the file name it is cached under.
+type soundFile struct {
+	name string
+	data []byte
+}
+
+// sounds maps each allowed sound type to its embedded audio.
+var sounds = map[string]soundFile{
+	"rocket": {name: "jet.wav", data: jetSound},
+	"honk":   {name: "honk.wav", data: honkSound},
+}
+
 var soundCacheOnce sync.Once
 
+// soundPlayer is a sound playback command and the flags that precede the file.
+type soundPlayer struct {
+	path string
+	args []string
+}
+
+// linuxSoundPlayers resolves the installed sound players once, in preference
+// order, so playback doesn't re-probe PATH or fork a missing binary each time.
+var linuxSoundPlayers = sync.OnceValue(func() []soundPlayer {
+	var players []soundPlayer
+	for _, player := range []soundPlayer{
+		{path: "paplay"},
+		{path: "aplay", args: []string{"-q"}},
+	} {
+		if path, err := exec.LookPath(player.path); err == nil {
+			players = append(players, soundPlayer{path: path, args: player.args})
+		}
+	}
+	return players
+})
+
 // initSoundCache writes embedded sounds to cache directory once.
 func (app *App) initSoundCache() {
 	soundCacheOnce.Do(func() {
@@ -31,19 +66,12 @@ func (app *App) initSoundCache() {
 			return
 		}
 
-		// Write jet sound
-		jetPath := filepath.Join(soundDir, "jet.wav")
-		if _, err := os.Stat(jetPath); os.IsNotExist(err) {
-			if err := os.WriteFile(jetPath, jetSound, 0o600); err != nil {
-				slog.Error("Failed to cache jet sound", "error", err)
-			}
-		}
-
-		// Write honk sound
-		honkPath := filepath.Join(soundDir, "honk.wav")
-		if _, err := os.Stat(honkPath); os.IsNotExist(err) {
-			if err := os.WriteFile(honkPath, honkSound, 0o600); err != nil {
-				slog.Error("Failed to cache honk sound", "error", err)
+		for _, sf := range sounds {
+			path := filepath.Join(soundDir, sf.name)
+			if _, err := os.Stat(path); os.IsNotExist(err) {
+				if err := os.WriteFile(path, sf.data, 0o600); err != nil {
+					slog.Error("Failed to cache sound", "sound", sf.name, "error", err)
+				}
 			}
 		}
 	})
@@ -66,16 +94,12 @@ func (app *App) playSound(ctx context.Context, soundType string) {
 	app.initSoundCache()
 
 	// Select the sound file with validation to prevent path traversal
-	allowedSounds := map[string]string{
-		"rocket": "jet.wav",
-		"honk":   "honk.wav",
-	}
-
-	soundName, ok := allowedSounds[soundType]
+	sf, ok := sounds[soundType]
 	if !ok {
 		slog.Error("Invalid sound type requested", "soundType", soundType)
 		return
 	}
+	soundName := sf.name
 
 	// Double-check the sound name contains no path separators
 	if strings.Contains(soundName, "/") || strings.Contains(soundName, "\\") || strings.Contains(soundName, "..") {
@@ -113,10 +137,15 @@ func (app *App) playSound(ctx context.Context, soundType string) {
 			cmd = exec.CommandContext(soundCtx, "cmd", "/c", "start", "/min", "", soundPath)
 		case "linux":
 			// Try paplay first (PulseAudio), then aplay (ALSA)
-			cmd = exec.CommandContext(soundCtx, "paplay", soundPath)
-			if err := cmd.Run(); err != nil {
-				cmd = exec.CommandContext(soundCtx, "aplay", "-q", soundPath)
+			err := errors.New("no sound player found (paplay, aplay)")
+			for _, player := range linuxSoundPlayers() {
+				bin, args := player.path, append(slices.Clone(player.args), soundPath)
+				if err = exec.CommandContext(soundCtx, bin, args...).Run(); err == nil {
+					return
+				}
 			}
+			slog.Error("Failed to play sound", "error", err)
+			return
 		default:
 			return
 		}
@@ -36,6 +36,12 @@ var (
 	white = color.RGBA{255, 255, 255, 255} // Text color
 )
 
+// boldFont parses Go's embedded monospace bold font once; the parsed font is
+// safe for concurrent use, so every badge shares it.
+var boldFont = sync.OnceValues(func() (*opentype.Font, error) {
+	return opentype.Parse(gomonobold.TTF)
+})
+
 // Badge generates a badge icon showing PR counts.
 //
 // Visual design for accessibility:
@@ -64,14 +70,13 @@ func Badge(incoming, outgoing int) ([]byte, error) {
 		drawSquare(img, green, format(outgoing))
 	}
 
-	var buf bytes.Buffer
-	if err := png.Encode(&buf, img); err != nil {
-		return nil, fmt.Errorf("encode png: %w", err)
-	}
-	return buf.Bytes(), nil
+	return encode(img)
 }
 
 // Scale resizes an icon to the standard tray size.
+//
+// Source icons are large (512×512) masters, so a Catmull-Rom kernel is used
+// to downsample them; nearest-neighbor drops most source pixels and aliases badly.
 func Scale(iconData []byte) ([]byte, error) {
 	src, err := png.Decode(bytes.NewReader(iconData))
 	if err != nil {
@@ -79,32 +84,73 @@ func Scale(iconData []byte) ([]byte, error) {
 	}
 
 	dst := image.NewRGBA(image.Rect(0, 0, Size, Size))
-	draw.NearestNeighbor.Scale(dst, dst.Bounds(), src, src.Bounds(), draw.Over, nil)
+	draw.CatmullRom.Scale(dst, dst.Bounds(), src, src.Bounds(), draw.Over, nil)
+
+	return encode(dst)
+}
+
+// encoder favors speed over size: tray icons are tiny, live only in memory,
+// and are handed straight to the system tray, so default compression buys nothing.
+// Its zlib writer and row buffers are recycled between renders.
+var encoder = &png.Encoder{
+	CompressionLevel: png.BestSpeed,
+	BufferPool:       &encoderBufferPool{},
+}
+
+// encoderBufferPool implements png.EncoderBufferPool on top of sync.Pool.
+type encoderBufferPool struct {
+	pool sync.Pool
+}
+
+// Get returns a recycled buffer, or nil to let the encoder allocate one.
+func (p *encoderBufferPool) Get() *png.EncoderBuffer {
+	if b, ok := p.pool.Get().(*png.EncoderBuffer); ok {
+		return b
+	}
+	return nil
+}
+
+// Put returns a buffer to the pool for reuse.
+func (p *encoderBufferPool) Put(b *png.EncoderBuffer) {
+	p.pool.Put(b)
+}
 
+// encode serializes img as PNG.
+func encode(img image.Image) ([]byte, error) {
 	var buf bytes.Buffer
-	if err := png.Encode(&buf, dst); err != nil {
+	if err := encoder.Encode(&buf, img); err != nil {
 		return nil, fmt.Errorf("encode png: %w", err)
 	}
 	return buf.Bytes(), nil
 }
 
-// drawCircle renders a large filled circle with bold centered text.
-func drawCircle(img *image.RGBA, fill color.RGBA, text string) {
+// circleSpans holds the [x0, x1) pixel run of each row of the badge circle.
+// The geometry depends only on Size, so it is computed once at startup.
+var circleSpans = func() (spans [Size][2]int) {
 	radius := float64(Size) / 2
 	cx := radius
 	cy := radius
 
-	// Draw filled circle
+	// Pixel centers within halfWidth of cx are inside, so each row is a
+	// single contiguous run. Rows outside the circle keep an empty span.
 	for py := range Size {
-		for px := range Size {
-			dx := float64(px) - cx + 0.5
-			dy := float64(py) - cy + 0.5
-			dist := math.Sqrt(dx*dx + dy*dy)
-
-			if dist <= radius {
-				img.Set(px, py, fill)
-			}
+		dy := float64(py) - cy + 0.5
+		if dy*dy > radius*radius {
+			continue
 		}
+		halfWidth := math.Sqrt(radius*radius - dy*dy)
+		x0 := max(int(math.Ceil(cx-halfWidth-0.5)), 0)
+		x1 := min(int(math.Floor(cx+halfWidth-0.5))+1, Size)
+		spans[py] = [2]int{x0, x1}
+	}
+	return spans
+}()
+
+// drawCircle renders a large filled circle with bold centered text.
+func drawCircle(img *image.RGBA, fill color.RGBA, text string) {
+	// Draw filled circle
+	for py := range Size {
+		fillRow(img, py, circleSpans[py][0], circleSpans[py][1], fill)
 	}
 
 	// Draw large bold centered text
@@ -114,11 +160,7 @@ func drawCircle(img *image.RGBA, fill color.RGBA, text string) {
 // drawSquare renders a solid square with bold centered text.
 func drawSquare(img *image.RGBA, fill color.RGBA, text string) {
 	// Fill entire image with color
-	for py := range Size {
-		for px := range Size {
-			img.Set(px, py, fill)
-		}
-	}
+	draw.Draw(img, img.Bounds(), image.NewUniform(fill), image.Point{}, draw.Src)
 
 	// Draw large bold centered text
 	drawBoldText(img, text, Size/2, Size/2)
@@ -126,15 +168,11 @@ func drawSquare(img *image.RGBA, fill color.RGBA, text string) {
 
 // drawDiagonalSplit renders a diagonal split with two numbers.
 func drawDiagonalSplit(img *image.RGBA, incomingText, outgoingText string) {
-	// Fill with diagonal split: red top-left, green bottom-right
+	// Fill with diagonal split: red top-left, green bottom-right.
+	// The edge px = Size-py splits each row into exactly two runs.
 	for py := range Size {
-		for px := range Size {
-			if px < Size-py {
-				img.Set(px, py, red)
-			} else {
-				img.Set(px, py, green)
-			}
-		}
+		fillRow(img, py, 0, Size-py, red)
+		fillRow(img, py, Size-py, Size, green)
 	}
 
 	// Draw incoming number in top-left quadrant (lowered 1 pixel)
@@ -144,10 +182,21 @@ func drawDiagonalSplit(img *image.RGBA, incomingText, outgoingText string) {
 	drawBoldText(img, outgoingText, 3*Size/4, 3*Size/4-1)
 }
 
+// fillRow paints pixels [x0, x1) of row y, writing straight into the pixel
+// buffer rather than going through img.Set and the color.Color interface.
+func fillRow(img *image.RGBA, y, x0, x1 int, c color.RGBA) {
+	row := img.Pix[y*img.Stride : y*img.Stride+4*x1]
+	for i := 4 * x0; i < len(row); i += 4 {
+		row[i] = c.R
+		row[i+1] = c.G
+		row[i+2] = c.B
+		row[i+3] = c.A
+	}
+}
+
 // drawBoldText renders large, professional text using Go's monospace bold font.
 func drawBoldText(img *image.RGBA, text string, centerX, centerY int) {
-	// Parse Go's embedded monospace bold font
-	face, err := opentype.Parse(gomonobold.TTF)
+	face, err := boldFont()
 	if err != nil {
 		return // Graceful fallback: show colored badge without text
 	}
@@ -227,6 +276,8 @@ func (c *Cache) Put(incoming, outgoing int, data []byte) {
 	c.icons[key(incoming, outgoing)] = data
 }
 
+// key identifies a badge by what it displays rather than the raw counts, so
+// counts that render identically (e.g. 12 and 15 both show "+") share one entry.
 func key(incoming, outgoing int) string {
-	return strconv.Itoa(incoming) + ":" + strconv.Itoa(outgoing)
+	return format(incoming) + ":" + format(outgoing)
 }
@@ -2,7 +2,9 @@ package icon
 
 import (
 	"bytes"
+	"image"
 	"image/png"
+	"math"
 	"testing"
 )
 
@@ -131,12 +133,33 @@ func TestScale(t *testing.T) {
 	}
 }
 
+func TestCacheSharesIdenticalBadges(t *testing.T) {
+	c := NewCache()
+	data := []byte("plus")
+	c.Put(12, 0, data)
+
+	// 15 renders as "+" just like 12, so it must hit the same entry
+	got, ok := c.Lookup(15, 0)
+	if !ok {
+		t.Fatal("expected cache hit for count that renders identically")
+	}
+	if !bytes.Equal(got, data) {
+		t.Error("cached data mismatch")
+	}
+
+	// Different displayed digits must not collide
+	if _, ok := c.Lookup(5, 0); ok {
+		t.Error("expected cache miss for a different displayed count")
+	}
+}
+
 func TestCacheOverflow(t *testing.T) {
 	c := NewCache()
 
-	// Fill cache to exactly 101 entries (exceeds limit of 100)
+	// Fill cache to exactly 101 entries (exceeds limit of 100). Counts above 9
+	// share a key, so spread entries over distinct displayed pairs.
 	for i := range 101 {
-		c.Put(i, 0, []byte("test"))
+		c.Put(i/11, i%11, []byte("test"))
 	}
 
 	// At this point we have 101 entries (exceeds limit but not cleared yet)
@@ -151,7 +174,7 @@ func TestCacheOverflow(t *testing.T) {
 	// Old entries should be gone after cache was cleared
 	found := 0
 	for i := range 101 {
-		if _, ok := c.Lookup(i, 0); ok {
+		if _, ok := c.Lookup(i/11, i%11); ok {
 			found++
 		}
 	}
@@ -159,3 +182,38 @@ func TestCacheOverflow(t *testing.T) {
 		t.Errorf("expected old entries to be cleared after overflow, but found %d", found)
 	}
 }
+
+func TestDrawCircleCoverage(t *testing.T) {
+	img := image.NewRGBA(image.Rect(0, 0, Size, Size))
+	drawCircle(img, red, "")
+
+	// Every pixel whose center lies within the radius must be filled, and none outside.
+	radius := float64(Size) / 2
+	for py := range Size {
+		for px := range Size {
+			dx := float64(px) - radius + 0.5
+			dy := float64(py) - radius + 0.5
+			inside := math.Sqrt(dx*dx+dy*dy) <= radius
+			if got := img.RGBAAt(px, py) == red; got != inside {
+				t.Fatalf("pixel (%d,%d): filled = %v, want %v", px, py, got, inside)
+			}
+		}
+	}
+}
+
+func TestDrawDiagonalSplitCoverage(t *testing.T) {
+	img := image.NewRGBA(image.Rect(0, 0, Size, Size))
+	drawDiagonalSplit(img, "", "")
+
+	for py := range Size {
+		for px := range Size {
+			want := green
+			if px < Size-py {
+				want = red
+			}
+			if got := img.RGBAAt(px, py); got != want {
+				t.Fatalf("pixel (%d,%d) = %v, want %v", px, py, got, want)
+			}
+		}
+	}
+}